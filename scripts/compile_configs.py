@@ -0,0 +1,29 @@
+#!/usr/bin/env python3
+"""
+Config Compiler for GrantOps.
+
+Regenerates config/agents.yaml.json, the JSON copy of config/agents.yaml
+that is read at runtime in place of the YAML whenever it is up to date.
+
+Usage:
+    python scripts/compile_configs.py
+"""
+
+import sys
+from pathlib import Path
+
+# Add scripts directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent))
+
+from core.llm import compile_agents_config
+from core.context import get_repo_root
+
+
+def main():
+    sidecar_path = compile_agents_config()
+    print(f"Wrote: {sidecar_path.relative_to(get_repo_root())}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,4 +1,5 @@
 # Core utilities for GrantOps
-from .llm import call_llm, get_agent_config
-from .context import build_draft_context, build_evaluate_context, build_parse_context
-from .git_ops import create_branch, commit_changes, get_current_branch
+#
+# Import from the submodules directly (core.llm, core.context, core.git_ops);
+# nothing is re-exported here so that importing one helper doesn't pull in
+# the LLM stack.
@@ -0,0 +1,87 @@
+"""
+On-disk cache helpers for GrantOps.
+
+Cached artifacts live under `.cache/` in the repository root and are
+never committed.
+"""
+
+import json
+import os
+import tempfile
+from pathlib import Path
+from typing import Any, Callable
+
+from .paths import get_repo_root
+
+
+def get_cache_dir(name: str) -> Path:
+    """
+    Get (and create) a named cache directory.
+
+    Args:
+        name: Cache namespace (e.g., 'context')
+
+    Returns:
+        Path to .cache/<name>/ in the repository root
+    """
+    cache_dir = get_repo_root() / ".cache" / name
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    return cache_dir
+
+
+def write_atomic(path: Path, content: str) -> None:
+    """
+    Write a file atomically so concurrent readers never see partial content.
+
+    Args:
+        path: Destination file
+        content: Text to write
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "w") as f:
+            f.write(content)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
+
+def cached_index_entry(key: str, source: Path, build: Callable[[], Any]) -> Any:
+    """
+    Get a JSON-serializable value from .cache/index.json, rebuilding it when
+    its source has changed.
+
+    Args:
+        key: Entry name in the index (e.g., 'sections')
+        source: File or directory the value is derived from; its mtime is
+            stored alongside the entry as '<key>_mtime'
+        build: Computes the value on a miss
+
+    Returns:
+        The cached or freshly built value
+    """
+    try:
+        mtime_ns = os.stat(source).st_mtime_ns
+    except FileNotFoundError:
+        return build()
+
+    index_path = get_repo_root() / ".cache" / "index.json"
+    try:
+        index = json.loads(index_path.read_bytes())
+    except (FileNotFoundError, ValueError):
+        index = {}
+
+    if key in index and index.get(f"{key}_mtime") == mtime_ns:
+        return index[key]
+
+    value = build()
+    index[key] = value
+    index[f"{key}_mtime"] = mtime_ns
+    try:
+        index_path.parent.mkdir(exist_ok=True)
+        write_atomic(index_path, json.dumps(index))
+    except OSError:
+        # Read-only checkout; the value is still correct, just not cached
+        pass
+    return value
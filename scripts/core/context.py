@@ -4,16 +4,15 @@ Context assembly utilities for GrantOps.
 Handles loading and combining context files for different operations.
 """
 
-from pathlib import Path
-from typing import Optional
+import io
+import os
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, Callable, Optional
 
-import yaml
-
-
-def get_repo_root() -> Path:
-    """Get the repository root directory."""
-    current = Path(__file__).resolve()
-    return current.parent.parent.parent
+from .cache import cached_index_entry
+from .paths import get_repo_root
+from .yaml_io import load_yaml
 
 
 def read_file(relative_path: str) -> str:
@@ -27,9 +26,17 @@ def read_file(relative_path: str) -> str:
         File contents as string, or empty string if file doesn't exist
     """
     file_path = get_repo_root() / relative_path
-    if not file_path.exists():
+    try:
+        return _read_cached(str(file_path), os.stat(file_path).st_mtime_ns)
+    except FileNotFoundError:
         return ""
-    return file_path.read_text()
+
+
+@lru_cache(maxsize=64)
+def _read_cached(path: str, mtime_ns: int) -> str:
+    """Read a file once per mtime, so repeat reads in a process are free."""
+    with open(path, "rb") as f:
+        return f.read().decode("utf-8")
 
 
 def read_yaml(relative_path: str) -> dict:
@@ -42,28 +49,128 @@ def read_yaml(relative_path: str) -> dict:
     Returns:
         Parsed YAML as dictionary
     """
-    content = read_file(relative_path)
+    return _parse_yaml(read_file(relative_path))
+
+
+def _parse_yaml(content: str) -> dict:
+    """Parse YAML text, treating empty content as an empty mapping."""
     if not content:
         return {}
-    return yaml.safe_load(content)
+
+    return load_yaml(content)
+
+
+def _read_concurrently(reader: Callable[[Any], Any], items: list, max_workers: int = 4) -> list:
+    """
+    Apply an I/O-bound reader to each item on a small thread pool.
+
+    Results are returned in the order of `items`. A single item is read
+    inline, without starting a pool. Only worth it when the number of
+    reads grows with the data (one per section); for a handful of files
+    the pool costs more than it saves.
+    """
+    if len(items) <= 1:
+        return [reader(item) for item in items]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as ex:
+        return list(ex.map(reader, items))
+
+
+class _ContextWriter:
+    """Accumulates context parts in one buffer, separated by a divider."""
+
+    def __init__(self, separator: str = "\n\n---\n\n") -> None:
+        self._buf = io.StringIO()
+        self._separator = separator
+        self._first = True
+
+    def emit(self, *chunks: str) -> None:
+        """Write one part, made up of the given chunks."""
+        if not self._first:
+            self._buf.write(self._separator)
+        for chunk in chunks:
+            self._buf.write(chunk)
+        self._first = False
+
+    def getvalue(self) -> str:
+        return self._buf.getvalue()
 
 
 def format_yaml_as_context(data: dict, title: str = "Metadata") -> str:
     """Format a dictionary as readable context for the LLM."""
     lines = [f"## {title}", ""]
     for key, value in data.items():
-        if isinstance(value, list):
-            lines.append(f"**{key}:**")
-            for item in value:
-                if isinstance(item, dict):
-                    lines.append(f"  - {item}")
-                else:
-                    lines.append(f"  - {item}")
-        else:
-            lines.append(f"**{key}:** {value}")
+        _emit_generic(lines, key, value)
+    return "\n".join(lines)
+
+
+def _emit_generic(lines: list[str], key: str, value) -> None:
+    if isinstance(value, list):
+        _emit_list(lines, key, value)
+    else:
+        _emit_scalar(lines, key, value)
+
+
+def _emit_scalar(lines: list[str], key: str, value) -> None:
+    lines.append(f"**{key}:** {value}")
+
+
+def _emit_list(lines: list[str], key: str, items: list) -> None:
+    lines.append(f"**{key}:**")
+    lines.extend([f"  - {item}" for item in items])
+
+
+# Known meta.yaml fields and how to render them
+_META_EMITTERS: dict[str, Callable[[list[str], str, Any], None]] = {
+    "title": _emit_scalar,
+    "source_reference": _emit_scalar,
+    "word_limit": _emit_scalar,
+    "scoring_weight": _emit_scalar,
+    "requirements": _emit_list,
+    "evaluation_criteria": _emit_list,
+}
+
+
+def _format_meta(meta: dict) -> str:
+    """
+    Format a section's meta.yaml as the "Section Requirements" context.
+
+    Known fields go straight to their emitter; anything else (or a known
+    list field that isn't a list) falls back to the generic formatting
+    of format_yaml_as_context.
+    """
+    lines = ["## Section Requirements", ""]
+    for key, value in meta.items():
+        emit = _META_EMITTERS.get(key)
+        if emit is None or (emit is _emit_list and not isinstance(value, list)):
+            emit = _emit_generic
+        emit(lines, key, value)
     return "\n".join(lines)
 
 
+def _fingerprint(relative_paths: list[str]) -> tuple[tuple[str, int], ...]:
+    """Pair each input file with its mtime (-1 if missing)."""
+    root = get_repo_root()
+    fingerprint = []
+    for relative_path in relative_paths:
+        try:
+            mtime_ns = os.stat(root / relative_path).st_mtime_ns
+        except FileNotFoundError:
+            mtime_ns = -1
+        fingerprint.append((relative_path, mtime_ns))
+    return tuple(fingerprint)
+
+
+@lru_cache(maxsize=64)
+def _cached_context(kind: str, args: tuple, fingerprint: tuple) -> str:
+    """
+    Assemble a context, reusing a previous result while its inputs are unchanged.
+
+    Memoized in-process only: CI checkouts give every file a fresh mtime
+    and don't keep .cache/, so an on-disk copy would never be hit there.
+    """
+    return _ASSEMBLERS[kind](*args)
+
+
 def build_draft_context(section_id: str) -> str:
     """
     Build the context for drafting a section.
@@ -81,34 +188,50 @@ def build_draft_context(section_id: str) -> str:
     Returns:
         Combined context string
     """
-    parts = []
+    section_dir = f"application/sections/{section_id}"
+    fingerprint = _fingerprint([
+        "config/prompts/drafter.md",
+        "context/project.md",
+        "context/style.md",
+        f"{section_dir}/meta.yaml",
+        f"{section_dir}/outline.md",
+    ])
+    return _cached_context("draft", (section_id,), fingerprint)
+
+
+def _assemble_draft_context(section_id: str) -> str:
+    """Assemble the drafting context from the files on disk."""
+    out = _ContextWriter()
+
+    section_dir = f"application/sections/{section_id}"
+    system_prompt = read_file("config/prompts/drafter.md")
+    project = read_file("context/project.md")
+    style = read_file("context/style.md")
+    meta_text = read_file(f"{section_dir}/meta.yaml")
+    outline = read_file(f"{section_dir}/outline.md")
 
     # System prompt
-    system_prompt = read_file("config/prompts/drafter.md")
     if system_prompt:
-        parts.append(system_prompt)
+        out.emit(system_prompt)
 
     # Project context
-    project = read_file("context/project.md")
     if project:
-        parts.append(f"# Project Context\n\n{project}")
+        out.emit("# Project Context\n\n", project)
 
     # Style guide
-    style = read_file("context/style.md")
     if style:
-        parts.append(f"# Style Guide\n\n{style}")
+        out.emit("# Style Guide\n\n", style)
 
     # Section metadata
-    meta = read_yaml(f"application/sections/{section_id}/meta.yaml")
+    meta = _parse_yaml(meta_text)
     if meta:
-        parts.append(format_yaml_as_context(meta, "Section Requirements"))
+        out.emit(_format_meta(meta))
 
     # Section outline
-    outline = read_file(f"application/sections/{section_id}/outline.md")
     if outline:
-        parts.append(f"# Structure Template\n\nFollow this structure:\n\n{outline}")
+        out.emit("# Structure Template\n\nFollow this structure:\n\n", outline)
 
-    return "\n\n---\n\n".join(parts)
+    return out.getvalue()
 
 
 def build_evaluate_context(section_id: str, mode: str) -> str:
@@ -127,43 +250,72 @@ def build_evaluate_context(section_id: str, mode: str) -> str:
     Returns:
         Combined context string
     """
-    parts = []
+    section_dir = f"application/sections/{section_id}"
+    inputs = [f"config/prompts/evaluator_{mode}.md", f"{section_dir}/draft.md"]
+    if mode == "style":
+        inputs.append("context/style.md")
+    elif mode == "logic":
+        inputs.append(f"{section_dir}/meta.yaml")
+    elif mode == "alignment":
+        inputs.append("context/project.md")
+        inputs.extend(
+            f"application/sections/{other}/draft.md"
+            for other in list_sections()
+            if other != section_id
+        )
+    return _cached_context("evaluate", (section_id, mode), _fingerprint(inputs))
+
+
+def _assemble_evaluate_context(section_id: str, mode: str) -> str:
+    """Assemble the evaluation context from the files on disk."""
+    out = _ContextWriter()
+
+    section_dir = f"application/sections/{section_id}"
+    mode_files = {
+        "style": "context/style.md",
+        "logic": f"{section_dir}/meta.yaml",
+        "alignment": "context/project.md",
+    }
+    system_prompt = read_file(f"config/prompts/evaluator_{mode}.md")
+    draft = read_file(f"{section_dir}/draft.md")
+    mode_content = read_file(mode_files[mode]) if mode in mode_files else ""
 
     # Mode-specific system prompt
-    prompt_file = f"config/prompts/evaluator_{mode}.md"
-    system_prompt = read_file(prompt_file)
     if system_prompt:
-        parts.append(system_prompt)
+        out.emit(system_prompt)
 
     # The draft to evaluate
-    draft = read_file(f"application/sections/{section_id}/draft.md")
     if draft:
-        parts.append(f"# Draft to Evaluate\n\n{draft}")
+        out.emit("# Draft to Evaluate\n\n", draft)
     else:
         raise ValueError(f"No draft found for section: {section_id}")
 
     # Mode-specific context
     if mode == "style":
-        style = read_file("context/style.md")
-        if style:
-            parts.append(f"# Style Guide\n\n{style}")
+        if mode_content:
+            out.emit("# Style Guide\n\n", mode_content)
 
     elif mode == "logic":
-        meta = read_yaml(f"application/sections/{section_id}/meta.yaml")
+        meta = _parse_yaml(mode_content)
         if meta:
-            parts.append(format_yaml_as_context(meta, "Section Requirements"))
+            out.emit(_format_meta(meta))
 
     elif mode == "alignment":
-        project = read_file("context/project.md")
-        if project:
-            parts.append(f"# Project Context\n\n{project}")
+        if mode_content:
+            out.emit("# Project Context\n\n", mode_content)
 
         # Include other sections for cross-reference
         other_sections = get_all_drafts(exclude=section_id)
         if other_sections:
-            parts.append(f"# Other Sections (for reference)\n\n{other_sections}")
+            out.emit("# Other Sections (for reference)\n\n", other_sections)
 
-    return "\n\n---\n\n".join(parts)
+    return out.getvalue()
+
+
+_ASSEMBLERS: dict[str, Callable[..., str]] = {
+    "draft": _assemble_draft_context,
+    "evaluate": _assemble_evaluate_context,
+}
 
 
 def build_parse_context(source_file: str) -> str:
@@ -176,21 +328,21 @@ def build_parse_context(source_file: str) -> str:
     Returns:
         Combined context string
     """
-    parts = []
+    out = _ContextWriter()
 
     # System prompt
     system_prompt = read_file("config/prompts/parser.md")
     if system_prompt:
-        parts.append(system_prompt)
+        out.emit(system_prompt)
 
     # Source document
     source = read_file(f"application/source/{source_file}")
     if source:
-        parts.append(f"# RFP Document\n\n{source}")
+        out.emit("# RFP Document\n\n", source)
     else:
         raise ValueError(f"Source file not found: {source_file}")
 
-    return "\n\n---\n\n".join(parts)
+    return out.getvalue()
 
 
 def get_all_drafts(exclude: Optional[str] = None) -> str:
@@ -203,25 +355,28 @@ def get_all_drafts(exclude: Optional[str] = None) -> str:
     Returns:
         Combined string of all drafts with section headers
     """
-    sections_dir = get_repo_root() / "application" / "sections"
-    if not sections_dir.exists():
-        return ""
+    candidates = [
+        (entry.name, os.path.join(entry.path, "draft.md"))
+        for entry in _section_entries()
+        if entry.name != exclude
+    ]
 
-    parts = []
-    for section_dir in sorted(sections_dir.iterdir()):
-        if not section_dir.is_dir():
-            continue
-        if section_dir.name == exclude:
-            continue
-        if section_dir.name.startswith("."):
-            continue
+    out = _ContextWriter(separator="\n\n")
+    for name, content in _read_concurrently(_read_draft, candidates, max_workers=8):
+        if content is not None:
+            out.emit("## ", name, "\n\n", content)
 
-        draft_file = section_dir / "draft.md"
-        if draft_file.exists():
-            content = draft_file.read_text()
-            parts.append(f"## {section_dir.name}\n\n{content}")
+    return out.getvalue()
 
-    return "\n\n".join(parts)
+
+def _read_draft(candidate: tuple[str, str]) -> tuple[str, Optional[str]]:
+    """Read one section's draft.md; content is None if it has no draft."""
+    name, draft_file = candidate
+    try:
+        with open(draft_file, "rb") as f:
+            return name, f.read().decode("utf-8")
+    except FileNotFoundError:
+        return name, None
 
 
 def list_sections() -> list[str]:
@@ -231,11 +386,24 @@ def list_sections() -> list[str]:
     Returns:
         List of section directory names
     """
+    return cached_index_entry(
+        "sections",
+        get_repo_root() / "application" / "sections",
+        lambda: [entry.name for entry in _section_entries()],
+    )
+
+
+def _section_entries() -> list[os.DirEntry]:
+    """Section directories under application/sections/, sorted by name."""
     sections_dir = get_repo_root() / "application" / "sections"
-    if not sections_dir.exists():
+    try:
+        with os.scandir(sections_dir) as it:
+            return sorted(
+                (
+                    e for e in it
+                    if e.is_dir(follow_symlinks=False) and not e.name.startswith(".")
+                ),
+                key=lambda e: e.name,
+            )
+    except FileNotFoundError:
         return []
-
-    return [
-        d.name for d in sorted(sections_dir.iterdir())
-        if d.is_dir() and not d.name.startswith(".")
-    ]
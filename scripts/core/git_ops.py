@@ -5,50 +5,108 @@ Provides utilities for branching, committing, and managing Git state
 within GitHub Actions workflows.
 """
 
+import atexit
+import os
+import re
+import shlex
 import subprocess
-from pathlib import Path
-from typing import Optional
+import sys
+from typing import Optional, Union
 
+from .paths import get_repo_root
 
-def get_repo_root() -> Path:
-    """Get the repository root directory."""
-    current = Path(__file__).resolve()
-    return current.parent.parent.parent
 
-
-def run_git(args: list[str], check: bool = True) -> subprocess.CompletedProcess:
+def run_git(
+    args: list[str],
+    check: bool = True,
+    capture: bool = True,
+    text: bool = False,
+) -> subprocess.CompletedProcess:
     """
     Run a git command in the repository root.
 
     Args:
         args: Git command arguments (without 'git' prefix)
         check: Whether to raise on non-zero exit
+        capture: Whether to capture stdout/stderr (otherwise git writes
+            straight to this process's streams)
+        text: Whether to decode captured output as text; only needed
+            when the caller parses stdout
 
     Returns:
-        CompletedProcess with stdout/stderr
+        CompletedProcess with stdout/stderr (bytes unless text=True)
     """
     return subprocess.run(
         ["git"] + args,
         cwd=get_repo_root(),
-        capture_output=True,
-        text=True,
+        capture_output=capture,
+        text=text,
         check=check,
     )
 
 
+class _GitSession:
+    """
+    Long-lived `git cat-file --batch-check` process for ref lookups.
+
+    Resolving a ref through the running process avoids paying git's
+    startup cost for every existence check.
+    """
+
+    def __init__(self) -> None:
+        self._proc: Optional[subprocess.Popen] = None
+
+    def _process(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._proc = subprocess.Popen(
+                ["git", "cat-file", "--batch-check=%(objectname) %(objecttype)"],
+                cwd=get_repo_root(),
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+            )
+        return self._proc
+
+    def resolve(self, rev: str) -> Optional[str]:
+        """
+        Resolve a revision to an object name.
+
+        Args:
+            rev: Any revision git understands (branch, ref, SHA, ...)
+
+        Returns:
+            The object name, or None if the revision does not exist
+        """
+        proc = self._process()
+        proc.stdin.write(f"{rev}\n")
+        proc.stdin.flush()
+        reply = proc.stdout.readline().split()
+        if len(reply) != 2 or reply[1] in ("missing", "ambiguous"):
+            return None
+        return reply[0]
+
+    def close(self) -> None:
+        """Shut down the helper process if it was started."""
+        if self._proc is not None and self._proc.poll() is None:
+            self._proc.stdin.close()
+            self._proc.wait()
+        self._proc = None
+
+
+_session = _GitSession()
+atexit.register(_session.close)
+
+
 def get_current_branch() -> str:
     """Get the name of the current Git branch."""
-    result = run_git(["rev-parse", "--abbrev-ref", "HEAD"])
+    result = run_git(["rev-parse", "--abbrev-ref", "HEAD"], text=True)
     return result.stdout.strip()
 
 
 def branch_exists(branch_name: str) -> bool:
     """Check if a branch exists (locally or remotely)."""
-    result = run_git(
-        ["rev-parse", "--verify", branch_name],
-        check=False
-    )
-    return result.returncode == 0
+    return _session.resolve(branch_name) is not None
 
 
 def create_branch(branch_name: str, checkout: bool = True) -> bool:
@@ -64,24 +122,24 @@ def create_branch(branch_name: str, checkout: bool = True) -> bool:
     """
     if branch_exists(branch_name):
         if checkout:
-            run_git(["checkout", branch_name])
+            run_git(["checkout", branch_name], capture=False)
         return False
 
     if checkout:
-        run_git(["checkout", "-b", branch_name])
+        run_git(["checkout", "-b", branch_name], capture=False)
     else:
-        run_git(["branch", branch_name])
+        run_git(["branch", branch_name], capture=False)
 
     return True
 
 
 def checkout_branch(branch_name: str) -> None:
     """Checkout an existing branch."""
-    run_git(["checkout", branch_name])
+    run_git(["checkout", branch_name], capture=False)
 
 
 def commit_changes(
-    files: list[str],
+    files: list[Union[str, os.PathLike]],
     message: str,
     author: Optional[str] = None,
 ) -> str:
@@ -96,22 +154,82 @@ def commit_changes(
     Returns:
         The commit SHA
     """
-    # Stage files
-    for file in files:
-        run_git(["add", file])
+    # Stage files in a single git invocation
+    if files:
+        run_git(["add", "--"] + [os.fspath(f) for f in files], capture=False)
 
     # Build commit command
     commit_args = ["commit", "-m", message]
     if author:
         commit_args.extend(["--author", author])
 
-    run_git(commit_args)
+    run_git(commit_args, capture=False)
 
     # Get the commit SHA
-    result = run_git(["rev-parse", "HEAD"])
+    result = run_git(["rev-parse", "HEAD"], text=True)
     return result.stdout.strip()
 
 
+def commit_and_branch(
+    files: list[Union[str, os.PathLike]],
+    message: str,
+    branch_name: str,
+    push: bool = False,
+    author: Optional[str] = None,
+) -> tuple[bool, str]:
+    """
+    Switch to a branch, stage files, commit, and optionally push in one go.
+
+    The git commands are chained in a single shell invocation, so the whole
+    sequence pays process startup once instead of once per command.
+
+    Args:
+        files: List of file paths (relative to repo root) to stage
+        message: Commit message
+        branch_name: Branch to commit on (created if it doesn't exist)
+        push: Whether to push the branch to origin with upstream tracking
+        author: Optional author string (format: "Name <email>")
+
+    Returns:
+        Tuple of (whether the branch was created, the commit SHA)
+    """
+    created = not branch_exists(branch_name)
+    checkout_args = ["checkout", "-b", branch_name] if created else ["checkout", branch_name]
+    commit_args = ["commit", "-m", message]
+    if author:
+        commit_args.extend(["--author", author])
+
+    commands = [
+        checkout_args,
+        ["add", "--"] + [os.fspath(f) for f in files],
+        commit_args,
+    ]
+    if push:
+        commands.append(["push", "-u", "origin", branch_name])
+    # Last, so its output is the final line on stdout
+    commands.append(["rev-parse", "HEAD"])
+
+    # Only stdout is captured (for the SHA); git's errors and progress
+    # still reach the terminal through stderr
+    script = " && ".join(shlex.join(["git"] + args) for args in commands)
+    try:
+        result = subprocess.run(
+            script,
+            shell=True,
+            cwd=get_repo_root(),
+            stdout=subprocess.PIPE,
+            text=True,
+            check=True,
+        )
+    except subprocess.CalledProcessError as e:
+        # Some failures (e.g. "nothing to commit") are reported on stdout
+        sys.stderr.write(e.stdout or "")
+        raise
+
+    commit_sha = result.stdout.strip().splitlines()[-1]
+    return created, commit_sha
+
+
 def push_branch(branch_name: Optional[str] = None, set_upstream: bool = True) -> None:
     """
     Push the current or specified branch to origin.
@@ -129,13 +247,13 @@ def push_branch(branch_name: Optional[str] = None, set_upstream: bool = True) ->
     else:
         push_args.extend(["origin", branch_name])
 
-    run_git(push_args)
+    run_git(push_args, capture=False)
 
 
 def get_changed_files() -> list[str]:
     """Get list of modified/untracked files."""
     # Get modified files
-    result = run_git(["status", "--porcelain"])
+    result = run_git(["status", "--porcelain"], text=True)
     files = []
     for line in result.stdout.strip().split("\n"):
         if line:
@@ -170,19 +288,23 @@ def get_next_version(prefix: str, identifier: str) -> int:
     Returns:
         Next available version number
     """
-    result = run_git(["branch", "-a"], check=False)
-    branches = result.stdout.strip().split("\n")
+    result = run_git(
+        [
+            "for-each-ref",
+            "--format=%(refname:short)",
+            f"refs/heads/{prefix}/{identifier}-v*",
+            f"refs/remotes/origin/{prefix}/{identifier}-v*",
+        ],
+        check=False,
+        text=True,
+    )
 
-    pattern = f"{prefix}/{identifier}-v"
+    version_re = re.compile(rf"(?:^|/){re.escape(prefix)}/{re.escape(identifier)}-v(\d+)$")
     max_version = 0
 
-    for branch in branches:
-        branch = branch.strip().replace("* ", "").replace("remotes/origin/", "")
-        if pattern in branch:
-            try:
-                version = int(branch.split("-v")[-1])
-                max_version = max(max_version, version)
-            except ValueError:
-                continue
+    for ref in result.stdout.splitlines():
+        match = version_re.search(ref)
+        if match:
+            max_version = max(max_version, int(match.group(1)))
 
     return max_version + 1
@@ -5,26 +5,77 @@ Provides a unified interface for calling different LLM providers
 based on the configuration in config/agents.yaml.
 """
 
+import functools
+import hashlib
+import inspect
+import json
 import os
+from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Callable, Optional
 
-import yaml
-import litellm
+from .cache import cached_index_entry, get_cache_dir, write_atomic
+from .context import read_file
+from .paths import get_repo_root
+from .yaml_io import load_yaml
 
+# litellm is imported where it is used (and yaml only inside core.yaml_io):
+# it is slow to import, and `--list`-style commands never need it.
 
-def get_repo_root() -> Path:
-    """Get the repository root directory."""
-    current = Path(__file__).resolve()
-    # Navigate up from scripts/core/llm.py to repo root
-    return current.parent.parent.parent
+
+# Set to "1" to also cache responses from agents with a non-zero temperature,
+# or to "0" to disable the response cache entirely
+LLM_CACHE_ENV = "GRANTOPS_LLM_CACHE"
+
+
+def _parse_agents_yaml(config_path: Path) -> dict:
+    """Parse agents.yaml with the fastest available YAML loader."""
+    with open(config_path, "r") as f:
+        return load_yaml(f)
+
+
+def compile_agents_config() -> Path:
+    """
+    Regenerate the JSON sidecar (config/agents.yaml.json) from agents.yaml.
+
+    Returns:
+        Path to the written sidecar
+    """
+    config_path = get_repo_root() / "config" / "agents.yaml"
+    sidecar_path = config_path.with_name(config_path.name + ".json")
+    write_atomic(sidecar_path, json.dumps(_parse_agents_yaml(config_path)))
+    return sidecar_path
+
+
+@lru_cache(maxsize=1)
+def _load_agents_config_cached(config_path: str, mtime_ns: int) -> dict:
+    """
+    Load agents.yaml; keyed on mtime so edits are picked up.
+
+    Prefers the JSON sidecar when it is at least as new as the YAML, and
+    refreshes the sidecar otherwise.
+    """
+    sidecar_path = Path(config_path + ".json")
+    try:
+        if os.stat(sidecar_path).st_mtime_ns >= mtime_ns:
+            return json.loads(sidecar_path.read_text())
+    except (FileNotFoundError, ValueError):
+        pass
+
+    config = _parse_agents_yaml(Path(config_path))
+    try:
+        write_atomic(sidecar_path, json.dumps(config))
+    except (OSError, TypeError):
+        # Read-only checkout or non-JSON values; YAML stays the source of truth
+        pass
+    return config
 
 
 def load_agents_config() -> dict:
     """Load the agents configuration from config/agents.yaml."""
     config_path = get_repo_root() / "config" / "agents.yaml"
-    with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+    mtime_ns = os.stat(config_path).st_mtime_ns
+    return _load_agents_config_cached(str(config_path), mtime_ns)
 
 
 def get_agent_config(agent_name: str) -> dict:
@@ -67,6 +118,9 @@ def load_system_prompt(prompt_spec: str) -> str:
     """
     Load a system prompt from various sources.
 
+    File prompts are read through core.context.read_file, so repeat loads
+    are cached until the file changes.
+
     Args:
         prompt_spec: Either inline text or a file reference like "file:path/to/prompt.md"
 
@@ -79,16 +133,158 @@ def load_system_prompt(prompt_spec: str) -> str:
         prompt_path = get_repo_root() / file_path
         if not prompt_path.exists():
             raise FileNotFoundError(f"System prompt file not found: {file_path}")
-        return prompt_path.read_text()
+        return read_file(file_path)
     else:
         # Inline prompt
         return prompt_spec
 
 
+def _response_cache_path(config: dict, messages: list[dict]) -> Optional[Path]:
+    """Cache file for a completion, or None if this call shouldn't be cached."""
+    setting = os.environ.get(LLM_CACHE_ENV)
+    if setting == "0" or (config["temperature"] != 0 and setting != "1"):
+        return None
+
+    key = hashlib.sha256(json.dumps({
+        "model": config["model"],
+        "temperature": config["temperature"],
+        "max_tokens": config["max_tokens"],
+        "messages": messages,
+    }, sort_keys=True).encode()).hexdigest()
+    try:
+        return get_cache_dir("llm") / f"{key}.txt"
+    except OSError:
+        # Read-only checkout; call the model uncached
+        return None
+
+
+def _cached_completion(func: Callable) -> Callable:
+    """
+    Persist completions under .cache/llm/, keyed on model settings and messages.
+
+    Only deterministic calls (temperature 0) are cached unless
+    GRANTOPS_LLM_CACHE=1 is set; GRANTOPS_LLM_CACHE=0 turns caching off.
+    Passing use_cache=False skips the lookup for one call, and the fresh
+    response replaces any cached one. A cache that can't be written is
+    treated as a miss. Works for both sync and async completers.
+    """
+    def lookup(cache_path: Optional[Path]) -> Optional[str]:
+        if cache_path is None:
+            return None
+        try:
+            return cache_path.read_text()
+        except OSError:
+            return None
+
+    def store(cache_path: Optional[Path], content: Optional[str]) -> None:
+        if cache_path is not None and content is not None:
+            try:
+                write_atomic(cache_path, content)
+            except OSError:
+                # Disk full or read-only; the response is still returned
+                pass
+
+    if inspect.iscoroutinefunction(func):
+        @functools.wraps(func)
+        async def async_wrapper(
+            config: dict,
+            messages: list[dict],
+            use_cache: bool = True,
+        ) -> str:
+            cache_path = _response_cache_path(config, messages)
+            content = lookup(cache_path) if use_cache else None
+            if content is None:
+                content = await func(config, messages)
+                store(cache_path, content)
+            return content
+
+        return async_wrapper
+
+    @functools.wraps(func)
+    def wrapper(config: dict, messages: list[dict], use_cache: bool = True) -> str:
+        cache_path = _response_cache_path(config, messages)
+        content = lookup(cache_path) if use_cache else None
+        if content is None:
+            content = func(config, messages)
+            store(cache_path, content)
+        return content
+
+    return wrapper
+
+
+@_cached_completion
+def _complete(config: dict, messages: list[dict]) -> str:
+    """Send messages to the configured model and return the response text."""
+    import litellm
+
+    response = litellm.completion(
+        model=config["model"],
+        messages=messages,
+        temperature=config["temperature"],
+        max_tokens=config["max_tokens"],
+    )
+    return response.choices[0].message.content
+
+
+@_cached_completion
+async def _acomplete(config: dict, messages: list[dict]) -> str:
+    """Async counterpart of _complete."""
+    import litellm
+
+    response = await litellm.acompletion(
+        model=config["model"],
+        messages=messages,
+        temperature=config["temperature"],
+        max_tokens=config["max_tokens"],
+    )
+    return response.choices[0].message.content
+
+
+def _is_anthropic_model(model: str) -> bool:
+    """Whether a litellm model identifier routes to Anthropic."""
+    return model.startswith(("claude", "anthropic/"))
+
+
+def _prepare_call(
+    agent_name: str,
+    prompt: str,
+    system_prompt: Optional[str],
+) -> tuple[dict, list[dict]]:
+    """Resolve the agent config and build the message list for a call."""
+    config = get_agent_config(agent_name)
+
+    # Determine system prompt priority:
+    # 1. Explicit parameter (highest priority)
+    # 2. Agent config system_prompt
+    # 3. None (no system prompt)
+    final_system_prompt = system_prompt
+    if final_system_prompt is None and "system_prompt" in config:
+        final_system_prompt = load_system_prompt(config["system_prompt"])
+
+    messages = []
+    if final_system_prompt:
+        if _is_anthropic_model(config["model"]):
+            # Anthropic only caches prompt prefixes marked explicitly; other
+            # providers (OpenAI, Gemini) cache a shared leading prefix
+            # automatically, which is why the system prompt always goes first
+            system_content = [{
+                "type": "text",
+                "text": final_system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }]
+        else:
+            system_content = final_system_prompt
+        messages.append({"role": "system", "content": system_content})
+    messages.append({"role": "user", "content": prompt})
+
+    return config, messages
+
+
 def call_llm(
     agent_name: str,
     prompt: str,
     system_prompt: Optional[str] = None,
+    use_cache: bool = True,
 ) -> str:
     """
     Call an LLM using the configuration for the specified agent.
@@ -97,33 +293,38 @@ def call_llm(
         agent_name: Name of the agent from config/agents.yaml
         prompt: The user prompt to send
         system_prompt: Optional system prompt (overrides agent config and defaults)
+        use_cache: Reuse a cached response for an identical earlier call
 
     Returns:
         The LLM's response text
     """
-    config = get_agent_config(agent_name)
+    config, messages = _prepare_call(agent_name, prompt, system_prompt)
+    return _complete(config, messages, use_cache=use_cache)
 
-    # Determine system prompt priority:
-    # 1. Explicit parameter (highest priority)
-    # 2. Agent config system_prompt
-    # 3. None (no system prompt)
-    final_system_prompt = system_prompt
-    if final_system_prompt is None and "system_prompt" in config:
-        final_system_prompt = load_system_prompt(config["system_prompt"])
 
-    messages = []
-    if final_system_prompt:
-        messages.append({"role": "system", "content": final_system_prompt})
-    messages.append({"role": "user", "content": prompt})
+async def call_llm_async(
+    agent_name: str,
+    prompt: str,
+    system_prompt: Optional[str] = None,
+    use_cache: bool = True,
+) -> str:
+    """
+    Async version of call_llm.
 
-    response = litellm.completion(
-        model=config["model"],
-        messages=messages,
-        temperature=config["temperature"],
-        max_tokens=config["max_tokens"],
-    )
+    Independent calls can be overlapped with asyncio.gather so that N
+    requests cost roughly one network round-trip instead of N.
 
-    return response.choices[0].message.content
+    Args:
+        agent_name: Name of the agent from config/agents.yaml
+        prompt: The user prompt to send
+        system_prompt: Optional system prompt (overrides agent config and defaults)
+        use_cache: Reuse a cached response for an identical earlier call
+
+    Returns:
+        The LLM's response text
+    """
+    config, messages = _prepare_call(agent_name, prompt, system_prompt)
+    return await _acomplete(config, messages, use_cache=use_cache)
 
 
 def list_agents() -> dict:
@@ -133,8 +334,11 @@ def list_agents() -> dict:
     Returns:
         Dictionary mapping agent names to their configurations
     """
-    config = load_agents_config()
-    return config.get("agents", {})
+    return cached_index_entry(
+        "agents",
+        get_repo_root() / "config" / "agents.yaml",
+        lambda: load_agents_config().get("agents", {}),
+    )
 
 
 def count_tokens(text: str, model: str = "gpt-4o") -> int:
@@ -149,4 +353,6 @@ def count_tokens(text: str, model: str = "gpt-4o") -> int:
         Estimated token count
     """
     # Use litellm's token counting
+    import litellm
+
     return litellm.token_counter(model=model, text=text)
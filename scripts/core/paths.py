@@ -0,0 +1,13 @@
+"""
+Repository path helpers for GrantOps.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+
+
+@lru_cache(maxsize=1)
+def get_repo_root() -> Path:
+    """Get the repository root directory."""
+    # Navigate up from scripts/core/paths.py to repo root
+    return Path(__file__).resolve().parent.parent.parent
@@ -0,0 +1,53 @@
+"""
+YAML loading and dumping for GrantOps.
+
+Chooses the libyaml-backed safe loader and dumper when PyYAML was built
+with libyaml, and the pure-Python ones otherwise. PyYAML itself is
+imported on first use, so `--list`-style commands never pay for it.
+"""
+
+from functools import lru_cache
+from typing import Any
+
+
+@lru_cache(maxsize=1)
+def _yaml():
+    """Import yaml and pick the fastest available safe loader/dumper."""
+    import yaml
+    try:
+        # manylinux wheels bundle libyaml; otherwise install libyaml-dev
+        # before building PyYAML
+        from yaml import CSafeDumper as SafeDumper, CSafeLoader as SafeLoader
+    except ImportError:
+        from yaml import SafeDumper, SafeLoader
+
+    return yaml, SafeLoader, SafeDumper
+
+
+def load_yaml(stream) -> Any:
+    """
+    Parse YAML with the safe loader.
+
+    Args:
+        stream: YAML text or an open file
+
+    Returns:
+        The parsed document
+    """
+    yaml, loader, _ = _yaml()
+    return yaml.load(stream, Loader=loader)
+
+
+def dump_yaml(data: Any, **kwargs) -> str:
+    """
+    Render data as YAML with the safe dumper.
+
+    Args:
+        data: Value to serialize
+        **kwargs: Output options passed to yaml.dump
+
+    Returns:
+        The YAML text
+    """
+    yaml, _, dumper = _yaml()
+    return yaml.dump(data, Dumper=dumper, **kwargs)
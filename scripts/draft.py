@@ -18,7 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from core.context import build_draft_context, read_file, list_sections, get_repo_root
 from core.llm import call_llm, list_agents, get_agent_config
-from core.git_ops import create_branch, commit_changes, get_next_version, generate_branch_name
+from core.git_ops import commit_and_branch, get_next_version, generate_branch_name
 
 
 def validate_section(section_id: str) -> bool:
@@ -35,13 +35,14 @@ def validate_section(section_id: str) -> bool:
     return has_meta or has_outline
 
 
-def generate_draft(section_id: str, agent_name: str = "drafter") -> str:
+def generate_draft(section_id: str, agent_name: str = "drafter", use_cache: bool = True) -> str:
     """
     Generate a draft for the specified section.
 
     Args:
         section_id: The section to draft
         agent_name: The agent to use for drafting (default: "drafter")
+        use_cache: Reuse a cached LLM response for identical inputs
 
     Returns:
         Generated draft content
@@ -71,6 +72,7 @@ def generate_draft(section_id: str, agent_name: str = "drafter") -> str:
         agent_name=agent_name,
         prompt=user_prompt,
         system_prompt=system_prompt,
+        use_cache=use_cache,
     )
 
     return draft
@@ -115,6 +117,11 @@ def main():
         action="store_true",
         help="Don't create a git commit (for local testing)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring any cached response"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -174,7 +181,11 @@ def main():
 
     # Generate the draft
     try:
-        draft = generate_draft(args.section_id, agent_name=args.agent)
+        draft = generate_draft(
+            args.section_id,
+            agent_name=args.agent,
+            use_cache=not args.no_cache,
+        )
     except Exception as e:
         print(f"Error generating draft: {e}")
         return 1
@@ -193,15 +204,14 @@ def main():
             branch_name = generate_branch_name("draft", args.section_id, version)
 
         # Create branch and commit
-        created = create_branch(branch_name, checkout=True)
-        status = "Created" if created else "Checked out"
-        print(f"{status} branch: {branch_name}")
-
         relative_path = f"application/sections/{args.section_id}/draft.md"
-        commit_sha = commit_changes(
+        created, commit_sha = commit_and_branch(
             files=[relative_path],
-            message=f"Draft {args.section_id} (auto-generated)\n\nGenerated by GrantOps draft workflow."
+            message=f"Draft {args.section_id} (auto-generated)\n\nGenerated by GrantOps draft workflow.",
+            branch_name=branch_name,
         )
+        status = "Created" if created else "Checked out"
+        print(f"{status} branch: {branch_name}")
         print(f"Committed: {commit_sha[:8]}")
 
         # Output for GitHub Actions
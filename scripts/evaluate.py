@@ -31,7 +31,12 @@ def validate_section(section_id: str) -> bool:
     return draft_path.exists()
 
 
-def evaluate_draft(section_id: str, mode: str, agent_name: str = "evaluator") -> str:
+def evaluate_draft(
+    section_id: str,
+    mode: str,
+    agent_name: str = "evaluator",
+    use_cache: bool = True,
+) -> str:
     """
     Evaluate a draft in the specified mode.
 
@@ -39,6 +44,7 @@ def evaluate_draft(section_id: str, mode: str, agent_name: str = "evaluator") ->
         section_id: The section to evaluate
         mode: Evaluation mode (style, logic, or alignment)
         agent_name: The agent to use for evaluation (default: "evaluator")
+        use_cache: Reuse a cached LLM response for identical inputs
 
     Returns:
         Evaluation feedback
@@ -68,6 +74,7 @@ def evaluate_draft(section_id: str, mode: str, agent_name: str = "evaluator") ->
         agent_name=agent_name,
         prompt=user_prompt,
         system_prompt=system_prompt,
+        use_cache=use_cache,
     )
 
     return evaluation
@@ -130,6 +137,11 @@ def main():
         default="stdout",
         help="Output destination (default: stdout)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring any cached response"
+    )
     parser.add_argument(
         "--list",
         action="store_true",
@@ -194,7 +206,12 @@ def main():
 
     # Run evaluation
     try:
-        evaluation = evaluate_draft(args.section_id, args.mode, agent_name=args.agent)
+        evaluation = evaluate_draft(
+            args.section_id,
+            args.mode,
+            agent_name=args.agent,
+            use_cache=not args.no_cache,
+        )
     except Exception as e:
         print(f"Error during evaluation: {e}")
         return 1
@@ -10,43 +10,68 @@ Usage:
 """
 
 import argparse
+import hashlib
 import json
+import math
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Optional
 
 # Add scripts directory to path for imports
 sys.path.insert(0, str(Path(__file__).parent))
 
-import yaml
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
+from core.cache import get_cache_dir, write_atomic
 from core.context import build_parse_context, get_repo_root
-from core.llm import call_llm, list_agents, get_agent_config
-from core.git_ops import commit_changes
+from core.llm import list_agents, get_agent_config
+from core.yaml_io import dump_yaml
 
 
-def list_source_files() -> list[str]:
-    """List available source files in application/source/."""
-    source_dir = get_repo_root() / "application" / "source"
-    if not source_dir.exists():
-        return []
+# Bump when the extraction logic changes so cached parses are not reused
+PARSER_VERSION = "1"
+
+# A reply that is nothing but a fenced ```json / ``` code block
+_FENCE_RE = re.compile(r"\A\s*```(?:json)?\n?(.*?)\n?```\s*\Z", re.DOTALL)
+
+# Fixed outline blocks, pre-encoded
+_OVERVIEW = b"## Overview\n\n[Introduce the section topic]\n\n"
+_SUMMARY = b"## Summary\n\n[Conclude the section]"
+_NO_REQUIREMENTS = b"[Draft content here]"
 
-    return [
-        f.name for f in source_dir.iterdir()
-        if f.is_file() and not f.name.startswith(".")
-    ]
+# Characters JSON leaves unescaped that YAML rejects (C1 controls,
+# surrogates, U+FFFE/U+FFFF) or folds as line breaks (NEL, LS, PS)
+_YAML_UNSAFE_RE = re.compile("[\x7f-\x9f\u2028\u2029\ud800-\udfff\ufffe\uffff]")
 
+# yaml.dump options for meta.yaml when the fast writer can't be used
+_META_DUMP_OPTIONS = {"default_flow_style": False, "sort_keys": False, "allow_unicode": True}
 
-def parse_rfp(source_file: str, agent_name: str = "parser") -> list[dict]:
+
+def list_source_files(root: Optional[Path] = None) -> list[str]:
     """
-    Parse an RFP document and extract section structure.
+    List available source files in application/source/.
 
     Args:
-        source_file: Filename in application/source/
-        agent_name: The agent to use for parsing (default: "parser")
-
-    Returns:
-        List of section dictionaries
+        root: Repository root (default: get_repo_root())
     """
+    source_dir = (root or get_repo_root()) / "application" / "source"
+    try:
+        with os.scandir(source_dir) as it:
+            return [e.name for e in it if e.is_file() and not e.name.startswith(".")]
+    except FileNotFoundError:
+        return []
+
+
+def _build_parse_prompts(source_file: str, agent_name: str) -> tuple[str, Optional[str]]:
+    """Build the (user prompt, system prompt) pair for parsing an RFP."""
     # Build context
     context = build_parse_context(source_file)
 
@@ -60,84 +85,259 @@ def parse_rfp(source_file: str, agent_name: str = "parser") -> list[dict]:
         system_prompt = None  # Let call_llm use the agent's configured prompt
     else:
         # Fallback: Extract system prompt from context (legacy behavior)
-        parts = context.split("\n\n---\n\n")
-        system_prompt = parts[0] if parts else ""
-        user_prompt = "\n\n---\n\n".join(parts[1:]) if len(parts) > 1 else context
+        system_prompt, sep, user_prompt = context.partition("\n\n---\n\n")
+        if not sep:
+            system_prompt, user_prompt = "", context
 
     # Add explicit instruction
     user_prompt += "\n\n---\n\nParse this RFP and return the JSON array of sections as specified."
 
-    # Call the LLM
+    return user_prompt, system_prompt
+
+
+def _parse_cache_path(
+    agent_name: str,
+    user_prompt: str,
+    system_prompt: Optional[str],
+) -> Optional[Path]:
+    """
+    Cache file for a parse result, or None if the cache is unavailable.
+
+    The key covers the source document and parser prompt (both part of the
+    assembled prompts), the agent settings, and PARSER_VERSION.
+    """
+    key = hashlib.sha256(json.dumps({
+        "version": PARSER_VERSION,
+        "agent": get_agent_config(agent_name),
+        "system_prompt": system_prompt,
+        "prompt": user_prompt,
+    }, sort_keys=True).encode()).hexdigest()
+    try:
+        return get_cache_dir("parse") / f"{key}.json"
+    except OSError:
+        # Read-only checkout; parse uncached
+        return None
+
+
+def _load_cached_parse(cache_path: Optional[Path]) -> Optional[list[dict]]:
+    """Load a cached parse result, or None on a miss."""
+    if cache_path is None:
+        return None
+    try:
+        return _loads(cache_path.read_bytes())
+    except (OSError, ValueError):
+        return None
+
+
+def _store_parse(cache_path: Optional[Path], sections: list[dict]) -> None:
+    """Cache a parse result; failing to write it is not an error."""
+    if cache_path is None:
+        return
+    try:
+        write_atomic(cache_path, json.dumps(sections, ensure_ascii=False))
+    except OSError:
+        # Disk full or read-only; the sections are still returned
+        pass
+
+
+def _extract_sections(response: str) -> list[dict]:
+    """Extract the JSON section list from the LLM response."""
+    # Common case: the whole reply is one fenced code block
+    match = _FENCE_RE.match(response)
+    if match:
+        return _loads(match.group(1))
+
+    # Otherwise slice from the first bracket to the matching last one,
+    # which skips any prose the LLM wrapped around the JSON
+    start, end = response.find("["), response.rfind("]")
+    if start == -1 or end == -1:
+        start, end = response.find("{"), response.rfind("}")
+    if start == -1 or end < start:
+        # Nothing JSON-like; let json report the error on the raw response
+        return _loads(response)
+
+    return _loads(response[start:end + 1])
+
+
+def parse_rfp(source_file: str, agent_name: str = "parser", use_cache: bool = True) -> list[dict]:
+    """
+    Parse an RFP document and extract section structure.
+
+    Args:
+        source_file: Filename in application/source/
+        agent_name: The agent to use for parsing (default: "parser")
+        use_cache: Reuse the result of an earlier parse of the same inputs,
+            including a cached LLM response
+
+    Returns:
+        List of section dictionaries
+    """
+    user_prompt, system_prompt = _build_parse_prompts(source_file, agent_name)
+
+    cache_path = _parse_cache_path(agent_name, user_prompt, system_prompt)
+    if use_cache:
+        cached = _load_cached_parse(cache_path)
+        if cached is not None:
+            return cached
+
+    # Call the LLM (imported here so listing/error paths never load it)
+    from core.llm import call_llm
+
     response = call_llm(
         agent_name=agent_name,
         prompt=user_prompt,
         system_prompt=system_prompt,
+        use_cache=use_cache,
     )
 
-    # Extract JSON from response
-    # Handle case where LLM wraps in markdown code block
-    response = response.strip()
-    if response.startswith("```json"):
-        response = response[7:]
-    if response.startswith("```"):
-        response = response[3:]
-    if response.endswith("```"):
-        response = response[:-3]
-
-    return json.loads(response.strip())
+    sections = _extract_sections(response)
+    _store_parse(cache_path, sections)
+    return sections
 
 
-def generate_outline(section: dict) -> str:
+async def parse_rfp_async(
+    source_file: str,
+    agent_name: str = "parser",
+    use_cache: bool = True,
+) -> list[dict]:
     """
-    Generate a structure template/outline for a section.
+    Async version of parse_rfp.
+
+    The whole structure comes back from one LLM call; outlines are then
+    generated locally. Any per-section enrichment added later should
+    schedule its calls together with asyncio.gather rather than awaiting
+    them one by one.
 
     Args:
-        section: Section dictionary from parser
+        source_file: Filename in application/source/
+        agent_name: The agent to use for parsing (default: "parser")
+        use_cache: Reuse the result of an earlier parse of the same inputs,
+            including a cached LLM response
 
     Returns:
-        Markdown outline template
+        List of section dictionaries
+    """
+    user_prompt, system_prompt = _build_parse_prompts(source_file, agent_name)
+
+    cache_path = _parse_cache_path(agent_name, user_prompt, system_prompt)
+    if use_cache:
+        cached = _load_cached_parse(cache_path)
+        if cached is not None:
+            return cached
+
+    from core.llm import call_llm_async
+
+    response = await call_llm_async(
+        agent_name=agent_name,
+        prompt=user_prompt,
+        system_prompt=system_prompt,
+        use_cache=use_cache,
+    )
+
+    sections = _extract_sections(response)
+    _store_parse(cache_path, sections)
+    return sections
+
+
+def _write_outline(section: dict, path: Path) -> None:
     """
-    lines = [f"# {section.get('title', 'Section Title')}", ""]
+    Write the structure template/outline for a section.
+
+    The outline is built as UTF-8 bytes in a single buffer and written
+    with one call, bypassing the text I/O layer.
+
+    Args:
+        section: Section dictionary from parser
+        path: Destination outline.md
+    """
+    # Add placeholders based on requirements, one per distinct requirement
+    requirements = list(dict.fromkeys(section.get("requirements", [])))
+
+    buf = bytearray(f"# {section.get('title', 'Section Title')}\n\n".encode("utf-8"))
 
-    # Add placeholders based on requirements
-    requirements = section.get("requirements", [])
     if requirements:
-        lines.append("## Overview")
-        lines.append("")
-        lines.append("[Introduce the section topic]")
-        lines.append("")
+        buf += _OVERVIEW
 
-        for i, req in enumerate(requirements, 1):
+        for req in requirements:
             # Create a heading for each requirement
-            lines.append(f"## {req[:50]}{'...' if len(req) > 50 else ''}")
-            lines.append("")
-            lines.append(f"[Address: {req}]")
-            lines.append("")
-
-        lines.append("## Summary")
-        lines.append("")
-        lines.append("[Conclude the section]")
+            head = req[:50] + ("..." if len(req) > 50 else "")
+            buf += f"## {head}\n\n[Address: {req}]\n\n".encode("utf-8")
+
+        buf += _SUMMARY
     else:
-        lines.append("[Draft content here]")
+        buf += _NO_REQUIREMENTS
+
+    path.write_bytes(buf)
+
+
+def _yaml_scalar(value) -> Optional[str]:
+    """
+    Render a value as a YAML flow scalar, or None if it needs yaml.dump.
+
+    JSON strings, ints, bools and plain decimal floats are also valid
+    YAML. Exponent and non-finite floats are not (PyYAML would load them
+    back as strings), and neither are strings containing characters that
+    YAML requires escaped but JSON leaves as-is.
+    """
+    if isinstance(value, str):
+        if _YAML_UNSAFE_RE.search(value):
+            return None
+    elif isinstance(value, float):
+        if not math.isfinite(value) or "e" in repr(value):
+            return None
+    elif not isinstance(value, (bool, int)):
+        return None
+    return json.dumps(value, ensure_ascii=False)
+
+
+def _dump_meta(meta: dict) -> str:
+    """
+    Render a section's meta dict as YAML.
 
+    meta.yaml has a flat schema (scalars plus lists of strings), so each
+    value is written as a JSON scalar, which is also a valid YAML flow
+    scalar. Keys keep their insertion order and non-ASCII text is
+    written as-is. Anything _yaml_scalar can't render falls back to
+    yaml.dump for the whole file.
+    """
+    lines = []
+    for key, value in meta.items():
+        if isinstance(value, list):
+            if not value:
+                lines.append(f"{key}: []")
+                continue
+            lines.append(f"{key}:")
+            for item in value:
+                scalar = _yaml_scalar(item)
+                if scalar is None:
+                    return dump_yaml(meta, **_META_DUMP_OPTIONS)
+                lines.append(f"- {scalar}")
+        else:
+            scalar = _yaml_scalar(value)
+            if scalar is None:
+                return dump_yaml(meta, **_META_DUMP_OPTIONS)
+            lines.append(f"{key}: {scalar}")
+    lines.append("")
     return "\n".join(lines)
 
 
-def create_section_directory(section: dict) -> Path:
+def create_section_directory(section: dict, root: Optional[Path] = None) -> Path:
     """
     Create a section directory with meta.yaml and outline.md.
 
     Args:
         section: Section dictionary from parser
+        root: Repository root (default: get_repo_root())
 
     Returns:
         Path to created directory
     """
     section_id = section.get("id", "unknown_section")
-    section_dir = get_repo_root() / "application" / "sections" / section_id
+    section_dir = (root or get_repo_root()) / "application" / "sections" / section_id
 
-    # Create directory
-    section_dir.mkdir(parents=True, exist_ok=True)
+    # Create directory (re-parses usually find it already there)
+    if not section_dir.is_dir():
+        section_dir.mkdir(parents=True, exist_ok=True)
 
     # Create meta.yaml
     meta = {
@@ -151,14 +351,12 @@ def create_section_directory(section: dict) -> Path:
     # Remove None values
     meta = {k: v for k, v in meta.items() if v is not None}
 
+    # Rendered up front and written in a single call
     meta_path = section_dir / "meta.yaml"
-    with open(meta_path, "w") as f:
-        yaml.dump(meta, f, default_flow_style=False, sort_keys=False, allow_unicode=True)
+    meta_path.write_bytes(_dump_meta(meta).encode("utf-8"))
 
     # Create outline.md
-    outline = generate_outline(section)
-    outline_path = section_dir / "outline.md"
-    outline_path.write_text(outline)
+    _write_outline(section, section_dir / "outline.md")
 
     return section_dir
 
@@ -192,6 +390,11 @@ def main():
         action="store_true",
         help="Don't create a git commit (for local testing)"
     )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Always call the LLM, ignoring cached parses and responses"
+    )
     parser.add_argument(
         "--dry-run",
         action="store_true",
@@ -199,6 +402,7 @@ def main():
     )
 
     args = parser.parse_args()
+    root = get_repo_root()
 
     # List agents mode
     if args.list_agents:
@@ -220,7 +424,7 @@ def main():
 
     # List source files mode
     if args.list:
-        files = list_source_files()
+        files = list_source_files(root=root)
         if files:
             print("Available source files:")
             for f in files:
@@ -237,7 +441,7 @@ def main():
         return 1
 
     # Check source file exists
-    source_path = get_repo_root() / "application" / "source" / args.source_file
+    source_path = root / "application" / "source" / args.source_file
     if not source_path.exists():
         print(f"Error: Source file not found: {source_path}")
         return 1
@@ -247,7 +451,11 @@ def main():
 
     # Parse the RFP
     try:
-        sections = parse_rfp(args.source_file, agent_name=args.agent)
+        sections = parse_rfp(
+            args.source_file,
+            agent_name=args.agent,
+            use_cache=not args.no_cache,
+        )
     except json.JSONDecodeError as e:
         print(f"Error: Failed to parse LLM response as JSON: {e}")
         return 1
@@ -267,20 +475,34 @@ def main():
             print(f"    Requirements: {len(section.get('requirements', []))}")
         return 0
 
-    # Create section directories
-    created_dirs = []
+    # Sections sharing an id (including those with no id) write the same
+    # directory; keep only the last of each so concurrent writes never
+    # collide and the last one wins, as it would when written in order
+    by_id = {}
     for section in sections:
-        section_dir = create_section_directory(section)
-        created_dirs.append(section_dir)
-        print(f"  Created: {section_dir.relative_to(get_repo_root())}")
+        section_id = section.get("id", "unknown_section")
+        by_id.pop(section_id, None)
+        by_id[section_id] = section
+    unique_sections = list(by_id.values())
+
+    # Create section directories (I/O-bound, so overlap them on threads;
+    # map preserves input order for the output below)
+    created_dirs = []
+    if unique_sections:
+        with ThreadPoolExecutor(max_workers=min(16, len(unique_sections))) as ex:
+            created_dirs = list(ex.map(partial(create_section_directory, root=root), unique_sections))
+    if created_dirs:
+        created_lines = [f"  Created: {d.relative_to(root)}" for d in created_dirs]
+        sys.stdout.write("\n".join(created_lines) + "\n")
 
     # Git commit (unless --no-commit)
     if not args.no_commit and created_dirs:
+        from core.git_ops import commit_changes
+
         files_to_commit = []
         for section_dir in created_dirs:
-            rel_dir = section_dir.relative_to(get_repo_root())
-            files_to_commit.append(str(rel_dir / "meta.yaml"))
-            files_to_commit.append(str(rel_dir / "outline.md"))
+            rel_dir = section_dir.relative_to(root)
+            files_to_commit.extend([rel_dir / "meta.yaml", rel_dir / "outline.md"])
 
         commit_sha = commit_changes(
             files=files_to_commit,